@@ -1,12 +1,6 @@
 import click
 from .hello_missing import hello_missing
-import uvicorn
-from fastapi import FastAPI
 import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file if it exists
-load_dotenv()
 
 
 @click.group()
@@ -33,6 +27,15 @@ def version():
 @click.option("--port", type=int, help="Port to run the FastAPI server on")
 def fastapi(host, port):
     """Start a FastAPI server with hello_missing as an endpoint"""
+    # Imported here so that lightweight commands like `run` and `version`
+    # don't pay the import cost of the server stack
+    import uvicorn
+    from fastapi import FastAPI
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file if it exists
+    load_dotenv()
+
     # Use environment variables or command-line arguments, with defaults
     host = host or os.getenv("MISSING_FAST_API_HOST", "0.0.0.0")
     port = port or int(os.getenv("MISSING_FAST_API_PORT", 8000))
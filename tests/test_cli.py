@@ -5,7 +5,7 @@ import pytest
 from unittest.mock import patch
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
     return CliRunner()
 
@@ -28,49 +28,36 @@ def test_version_command(runner):
     assert "Missing Text v" in result.output
 
 
+@pytest.mark.parametrize(
+    "env, args, expected_host, expected_port",
+    [
+        ({}, [], "0.0.0.0", 8000),
+        ({}, ["--host", "0.0.0.0", "--port", "5000"], "0.0.0.0", 5000),
+        (
+            {"MISSING_FAST_API_HOST": "127.0.0.1", "MISSING_FAST_API_PORT": "5000"},
+            [],
+            "127.0.0.1",
+            5000,
+        ),
+        (
+            {"MISSING_FAST_API_HOST": "127.0.0.1", "MISSING_FAST_API_PORT": "5000"},
+            ["--host", "0.0.0.0", "--port", "9000"],
+            "0.0.0.0",
+            9000,
+        ),
+    ],
+    ids=["defaults", "cli_args", "env_variables", "cli_args_override_env"],
+)
 @patch("uvicorn.run")
-def test_fastapi_command(mock_run, runner):
-    result = runner.invoke(main, ["fastapi"])
+def test_fastapi_command(mock_run, runner, env, args, expected_host, expected_port):
+    with patch.dict(os.environ, env):
+        result = runner.invoke(main, ["fastapi", *args])
     assert result.exit_code == 0
-    assert "Starting FastAPI server on http://0.0.0.0:8000" in result.output
-    mock_run.assert_called_once()
-
-
-@patch("uvicorn.run")
-def test_fastapi_command_with_custom_host_and_port(mock_run, runner):
-    result = runner.invoke(main, ["fastapi", "--host", "0.0.0.0", "--port", "5000"])
-    assert result.exit_code == 0
-    assert "Starting FastAPI server on http://0.0.0.0:5000" in result.output
-    mock_run.assert_called_once()
-
-
-@patch("uvicorn.run")
-def test_fastapi_command_with_env_variables(mock_run, runner):
-    with patch.dict(
-        os.environ,
-        {"MISSING_FAST_API_HOST": "127.0.0.1", "MISSING_FAST_API_PORT": "5000"},
-    ):
-        result = runner.invoke(main, ["fastapi"])
-        assert result.exit_code == 0
-        assert "Starting FastAPI server on http://127.0.0.1:5000" in result.output
-        mock_run.assert_called_once()
-
-
-@patch("uvicorn.run")
-def test_fastapi_command_with_default_values(mock_run, runner):
-    result = runner.invoke(main, ["fastapi"])
-    assert result.exit_code == 0
-    assert "Starting FastAPI server on http://0.0.0.0:8000" in result.output
-    mock_run.assert_called_once()
-
-
-@patch("uvicorn.run")
-def test_fastapi_command_cli_args_override_env_variables(mock_run, runner):
-    with patch.dict(
-        os.environ,
-        {"MISSING_FAST_API_HOST": "127.0.0.1", "MISSING_FAST_API_PORT": "5000"},
-    ):
-        result = runner.invoke(main, ["fastapi", "--host", "0.0.0.0", "--port", "9000"])
-        assert result.exit_code == 0
-        assert "Starting FastAPI server on http://0.0.0.0:9000" in result.output
-        mock_run.assert_called_once()
+    assert (
+        f"Starting FastAPI server on http://{expected_host}:{expected_port}"
+        in result.output
+    )
+    assert mock_run.call_count == 1
+    kwargs = mock_run.call_args.kwargs
+    assert kwargs["host"] == expected_host
+    assert kwargs["port"] == expected_port